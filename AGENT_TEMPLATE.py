@@ -10,7 +10,7 @@ Instructions for competitors:
 The framework will automatically discover and load your agent.
 """
 
-from kuhn3p import Player
+from kuhn3p import Player, TabularPolicy
 from kuhn3p import betting, deck
 import random
 
@@ -24,6 +24,16 @@ class TemplateAgent(Player):
     - Implement the act() method
     - Optionally implement start_hand() and end_hand() for state tracking
     
+    Table-driven agents
+    ===================
+    If your decisions depend only on the betting state and your card (and
+    possibly a random draw), you can inherit from kuhn3p.TabularPolicy
+    instead, as SmartAgent below does: implement action_probability() in
+    place of act() and call self.build_table() at the end of __init__.  The
+    framework then looks your decisions up in a precomputed table, which
+    makes matches faster.  The table is built once, so such an agent cannot
+    use state it tracks during play.
+    
     IMPORTANT: Safeguards Against Cheating
     ======================================
     The tournament framework includes anti-cheating mechanisms:
@@ -133,7 +143,7 @@ class TemplateAgent(Player):
         return f"{self.name}(hands={self.hand_count})"
 
 
-class SmartAgent(Player):
+class SmartAgent(TabularPolicy, Player):
     """
     A slightly more sophisticated example using card strength and position.
     """
@@ -145,9 +155,16 @@ class SmartAgent(Player):
         """
         self.aggression = aggression
         self.rng = rng if rng is not None else random.Random()
+        self.build_table()
     
-    def act(self, state, card):
-        """Make decisions based on card strength and position."""
+    def action_probability(self, state, card):
+        """
+        Make decisions based on card strength and position.
+        
+        Called once per (state, card) pair by build_table(), not during
+        play: attributes changed after __init__ (e.g. in start_hand() or
+        end_hand()) are never seen here.
+        """
         
         # Calculate basic card strength (0 to 1)
         card_strength = card / float(deck.ACE)
@@ -155,18 +172,18 @@ class SmartAgent(Player):
         if betting.can_bet(state):
             # Decide whether to bet
             # More likely to bet with strong cards or if aggressive
-            if card_strength > 0.5 or self.rng.random() < (self.aggression * 0.2):
-                return betting.BET
+            if card_strength > 0.5:
+                return 1.0
             else:
-                return betting.CHECK
+                return self.aggression * 0.2
         else:
             # Decide whether to call
             # More likely to call with strong cards or if aggressive
             call_threshold = 0.5 - (self.aggression * 0.3)
             if card_strength > call_threshold:
-                return betting.CALL
+                return 0.0  # CALL
             else:
-                return betting.FOLD
+                return 1.0  # FOLD
     
     def __str__(self):
         return f"SmartAgent(aggression={self.aggression})"
@@ -1,4 +1,5 @@
 from kuhn3p import deck, dealer, players
+from kuhn3p.validator import validate_agents
 from random import Random
 
 rng = Random()
@@ -8,6 +9,7 @@ num_hands   = 3000
 the_players = [players.Chump(0.99, 0.01, 0.0), 
     players.Chump(0.99, 0.01, 0.0), 
     players.Bluffer(0.2) ]
+validated   = validate_agents(the_players)
 
 total = [0, 0, 0]
 for hand in range(num_hands):
@@ -15,7 +17,7 @@ for hand in range(num_hands):
 	second         = (first + 1) % 3
 	third          = (second + 1) % 3
 
-	this_players   = [the_players[first], the_players[second], the_players[third]]
+	this_players   = [validated[first], validated[second], validated[third]]
 
 	(state, delta) = dealer.play_hand(this_players, deck.shuffled(rng))
 	for i in range(3):
@@ -1,4 +1,19 @@
 class Player:
+    # Empty so that subclasses can declare __slots__ of their own; those
+    # that don't still get a __dict__ as usual.
+    __slots__ = ()
+
+    # Whether end_hand() must be called.  Subclasses whose end_hand() does
+    # nothing can set this to False so the dealer skips the call (and
+    # building shown_cards) altogether.
+    needs_end_hand = True
+
+    # Whether instances never change after construction (all decisions come
+    # from fixed parameters).  The agent registry then hands out one shared
+    # instance per registered name instead of building a new one each time.
+    # Not inherited: each class that qualifies must declare it itself.
+    STATELESS = False
+
     def __init__(self):
         pass
 
@@ -1,7 +1,17 @@
 from .Player import Player
 from . import betting
 from . import deck
+from .policy import TabularPolicy
 from . import dealer
-from . import tournament
-from . import agents
 from . import players
+
+# tournament (multiprocessing, concurrent.futures, csv, json) and agents
+# (inspect, importlib) are comparatively slow to import and not needed to
+# play hands, so they are imported on first access.
+_LAZY_SUBMODULES = ('tournament', 'agents')
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        import importlib
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,8 @@
+"""
+Namespace for agent modules loaded from files by
+kuhn3p.agents.load_agents_from_directory.
+
+Agent files are registered here as kuhn3p._agents.<file stem> rather than
+under their bare stem, so that they can never shadow a standard library or
+installed module of the same name.
+"""
@@ -1,17 +1,38 @@
 """Agent management and registry for tournament framework."""
 
-import importlib
+import functools
+import importlib.util
 import inspect
-from pathlib import Path
+import os
+import sys
 from kuhn3p import Player
 
 
+# Agent files already loaded: resolved path -> (mtime_ns, {agent_name: agent_class})
+_MODULE_CACHE = {}
+
+# Package that agent modules loaded from files are registered under
+_AGENT_PACKAGE = 'kuhn3p._agents'
+
+
+@functools.lru_cache(maxsize=None)
+def _params_for(agent_class):
+    """Return {param: default} for an agent class's __init__ (cached per class)."""
+    sig = inspect.signature(agent_class.__init__)
+    return {
+        param: sig.parameters[param].default
+        for param in sig.parameters
+        if param not in ('self', 'rng')
+    }
+
+
 class AgentRegistry:
     """Registry for managing and loading tournament agents."""
     
     def __init__(self):
         self.agents = {}  # name -> player_class
         self.instances = {}  # name -> player_instance
+        self._singletons = {}  # name -> shared instance of a STATELESS class
     
     def register(self, name, agent_class, **default_kwargs):
         """
@@ -24,6 +45,7 @@ class AgentRegistry:
         """
         assert issubclass(agent_class, Player), f"{agent_class} must extend Player"
         self.agents[name] = (agent_class, default_kwargs)
+        self._singletons.pop(name, None)
     
     def create(self, name, **kwargs):
         """
@@ -34,14 +56,22 @@ class AgentRegistry:
             **kwargs: Initialization parameters (override defaults)
             
         Returns:
-            Player instance
+            Player instance; for a STATELESS class created with its
+            registered defaults, the same instance on every call
         """
         if name not in self.agents:
             raise ValueError(f"Agent '{name}' not registered. Available: {list(self.agents.keys())}")
         
+        if not kwargs and name in self._singletons:
+            return self._singletons[name]
+        
         agent_class, defaults = self.agents[name]
         params = {**defaults, **kwargs}
-        return agent_class(**params)
+        agent = agent_class(**params)
+        # Only a class that declares STATELESS itself: a subclass may add state
+        if not kwargs and vars(agent_class).get('STATELESS', False):
+            self._singletons[name] = agent
+        return agent
     
     def create_instance(self, name, **kwargs):
         """Create and cache an instance."""
@@ -59,17 +89,12 @@ class AgentRegistry:
             raise ValueError(f"Agent '{name}' not registered")
         
         agent_class, defaults = self.agents[name]
-        sig = inspect.signature(agent_class.__init__)
         
         return {
             'name': name,
             'class': agent_class.__name__,
             'module': agent_class.__module__,
-            'parameters': {
-                param: sig.parameters[param].default 
-                for param in sig.parameters 
-                if param not in ('self', 'rng')
-            },
+            'parameters': dict(_params_for(agent_class)),
             'defaults': defaults,
         }
 
@@ -122,24 +147,107 @@ def load_agents_from_directory(directory):
     Returns:
         Dictionary of {agent_name: agent_class}
     """
+    dir_path = os.path.realpath(directory)
+    
+    # A directory whose agent files are all unchanged is not rescanned
+    with os.scandir(dir_path) as entries:
+        listing = tuple(sorted(
+            (entry.name, entry.stat().st_mtime_ns)
+            for entry in entries
+            if (entry.name.endswith('.py') and
+                not entry.name.startswith('_') and
+                entry.is_file())
+        ))
+    return dict(_load_directory(dir_path, listing))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_directory(dir_path, listing):
+    """Load the agent files in listing, as (file name, mtime) pairs."""
     agents = {}
-    dir_path = Path(directory)
     
-    for py_file in dir_path.glob('*.py'):
-        if py_file.name.startswith('_'):
+    for file_name, mtime in listing:
+        py_file = os.path.join(dir_path, file_name)
+        
+        # Unchanged files are not re-executed
+        cached = _MODULE_CACHE.get(py_file)
+        if cached is not None and cached[0] == mtime:
+            agents.update(cached[1])
             continue
         
-        module_name = py_file.stem
-        spec = importlib.util.spec_from_file_location(module_name, py_file)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        module_name = _free_module_name(file_name[:-len('.py')])
+        module = _exec_agent_module(module_name, py_file)
         
         # Find all Player subclasses in the module
-        for name, obj in inspect.getmembers(module):
+        found = {
+            name: obj
+            for name, obj in vars(module).items()
             if (inspect.isclass(obj) and 
                 issubclass(obj, Player) and 
                 obj is not Player and
-                obj.__module__ == module_name):
-                agents[name] = obj
+                obj.__module__ == module_name)
+        }
+        _MODULE_CACHE[py_file] = (mtime, found)
+        agents.update(found)
     
     return agents
+
+
+def _free_module_name(stem):
+    """
+    Return an unused module name for an agent file under the agent package.
+    
+    A name is never reused, so a changed file loaded again gets a new module
+    and instances of the classes loaded before keep pickling by name.
+    """
+    module_name = f"{_AGENT_PACKAGE}.{stem}"
+    suffix = 1
+    while module_name in sys.modules:
+        module_name = f"{_AGENT_PACKAGE}.{stem}_{suffix}"
+        suffix += 1
+    return module_name
+
+
+def _exec_agent_module(module_name, path):
+    """
+    Execute an agent file as module_name and register it in sys.modules.
+    
+    The module is registered so that agent instances can be pickled
+    (parallel runs); callers pass a name that is not yet in use, and it is
+    removed again if executing the file fails.
+    """
+    import kuhn3p._agents
+    
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    return module
+
+
+def _agent_files(agent_list):
+    """
+    Return the (module name, path) of every agent module loaded from a file
+    that the classes of agent_list come from, base classes first.
+    """
+    files = {}
+    for agent in agent_list:
+        for cls in reversed(type(agent).__mro__):
+            module_name = cls.__module__
+            if module_name.startswith(_AGENT_PACKAGE + '.'):
+                files[module_name] = sys.modules[module_name].__file__
+    return tuple(files.items())
+
+
+def _import_agent_files(agent_files):
+    """
+    Load agent modules listed by _agent_files() under the same names, e.g. in
+    a freshly spawned worker process; modules already present are kept.
+    """
+    for module_name, path in agent_files:
+        if module_name not in sys.modules:
+            _exec_agent_module(module_name, path)
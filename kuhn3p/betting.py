@@ -37,23 +37,31 @@ def is_internal(state):
     assert is_valid(state)
     return state < num_internal()
 
+# the betting predicates are evaluated on every decision, so they are
+# tabulated by state; the dealer reads these tables directly in its hand loop
+_IS_TERMINAL = tuple(state >= num_internal() for state in range(num_states()))
+_ACTOR       = tuple(state % 3 for state in range(num_internal()))
+_CAN_BET     = tuple(state // 3 == 0 for state in range(num_internal()))
+_NUM_ACTIONS = (2,) * num_internal()
+
 def is_terminal(state):
     assert is_valid(state)
-    return not is_internal(state)
+    return _IS_TERMINAL[state]
 
 def root():
     return 0
 
 def actor(state):
     assert is_internal(state)
-    return state % 3
+    return _ACTOR[state]
 
 def to_decision(state):
     assert is_internal(state)
     return state // 3
 
 def can_bet(state):
-    return to_decision(state) == 0
+    assert is_internal(state)
+    return _CAN_BET[state]
 
 def can_call(state):
     assert is_internal(state)
@@ -76,10 +84,9 @@ def call_closes_action(state):
 
 def num_actions(state):
     assert is_internal(state)
-    return 2
+    return _NUM_ACTIONS[state]
 
-def act(state, action):
-    assert action < num_actions(state)
+def _next_state(state, action):
     player, decision = actor(state), to_decision(state)
 
     if decision == 0:
@@ -106,6 +113,17 @@ def act(state, action):
         else:
             return num_internal() + 1 + (player+1)%3 + 3
 
+# act() runs for every decision of every hand, so the transitions are
+# tabulated once: _TRANSITIONS[state][action] is the successor state.
+_TRANSITIONS = tuple(
+    (_next_state(state, 0), _next_state(state, 1))
+    for state in range(num_internal())
+)
+
+def act(state, action):
+    assert action < num_actions(state)
+    return _TRANSITIONS[state][action]
+
 def action_name(state, action):
     assert action < num_actions(state)
 
@@ -149,6 +167,13 @@ def at_showdown(state, player):
     else:
         return False
 
+# bit i of _SHOWDOWN_MASK[state] is set if player i shows their card in
+# that state (always 0 for internal states)
+_SHOWDOWN_MASK = tuple(
+    sum(at_showdown(state, i) << i for i in range(3)) if is_terminal(state) else 0
+    for state in range(num_states())
+)
+
 def bettor(state):
     assert is_terminal(state)
     assert state >= num_internal() + 1
@@ -1,52 +1,317 @@
 from kuhn3p import betting, deck
+from kuhn3p.policy import RANDOM
 from kuhn3p.validator import AgentValidator
 
+def _outcome(state):
+	if betting.is_showdown(state):
+		contenders = tuple(i for i in range(3) if betting.at_showdown(state, i))
+		bettor     = -1
+	else:
+		contenders = ()
+		bettor     = betting.bettor(state)
+
+	pot_size = betting.pot_size(state)
+	deltas   = tuple(
+		tuple(pot_size*(i == w) - betting.pot_contribution(state, i) for i in range(3))
+		for w in range(3)
+	)
+	return (contenders, bettor, deltas)
+
+# Everything needed to settle a hand depends only on the terminal state, so
+# it is tabulated once: the seats still in at showdown (empty after a fold),
+# the bettor who wins uncontested, and each seat's payoff for every winner.
+_OUTCOMES = tuple(
+	_outcome(state) if betting.is_terminal(state) else None
+	for state in range(betting.num_states())
+)
+
+# Every hand is zero-sum; anything summing per-hand payoffs relies on this.
+assert all(
+	sum(deltas) == 0
+	for outcome in _OUTCOMES if outcome is not None
+	for deltas in outcome[2]
+)
+
 def winner(state, cards):
 	assert betting.is_terminal(state)
-	if betting.is_showdown(state):
+	contenders, bettor, _ = _OUTCOMES[state]
+	if contenders:
 		best_player = -1
 		best_card   = -1
-		for i in range(3):
-			if betting.at_showdown(state, i) and cards[i] > best_card:
+		for i in contenders:
+			if cards[i] > best_card:
 				best_player = i
 				best_card   = cards[i] 
 		return best_player
 	else:
-		return betting.bettor(state)
+		return bettor
 
-def play_hand(players, cards):
-	state = betting.root()
-	
-	# Wrap players with validation if not already wrapped
-	validated_players = [
-		AgentValidator(p, f"Player_{i}") if not isinstance(p, AgentValidator) else p
+def _safe_act(validated, state, card):
+	try:
+		return validated.act(state, card)
+	except (ValueError, RuntimeError) as e:
+		# Invalid action: force the minimum loss action (check if possible,
+		# otherwise fold) and carry on with the hand
+		if betting._CAN_BET[state]:
+			return betting.CHECK
+		else:
+			return betting.FOLD
+
+# Validator labels for the three seats, built once.
+_PLAYER_NAMES = ("Player_0", "Player_1", "Player_2")
+
+def _wrap_players(players):
+	# Wrap each player that is not already an AgentValidator (or subclass).
+	return [
+		p if isinstance(p, AgentValidator) else AgentValidator(p, _PLAYER_NAMES[i])
 		for i, p in enumerate(players)
 	]
 
+def play_hand(validated_players, cards, rand=None):
+	# Players should already be wrapped in AgentValidator (Match does this
+	# once per match rather than once per hand).  Any that are not are
+	# wrapped here, for this hand only; the exact type check keeps that
+	# guard cheap for the usual case.
+	#
+	# Decisions of validated tabular players are read from their tables
+	# without calling into the agent.  If rand (a callable returning floats
+	# in [0, 1), e.g. the match's rng.random) is given, their randomised
+	# decisions are drawn from it; otherwise they go through the agent's own
+	# act() and rng.
+	is_terminal = betting._IS_TERMINAL
+	actor       = betting._ACTOR
+	transitions = betting._TRANSITIONS
+
+	if not (type(validated_players[0]) is AgentValidator
+			and type(validated_players[1]) is AgentValidator
+			and type(validated_players[2]) is AgentValidator):
+		validated_players = _wrap_players(validated_players)
+
+	state = betting.root()
+
 	for i in range(3):
 		validated_players[i].start_hand(i, cards[i])
 
-	while not betting.is_terminal(state):
-		player = betting.actor(state)
-		try:
-			action = validated_players[player].act(state, cards[player])
-		except (ValueError, RuntimeError) as e:
-			# Invalid action: agent loses this hand
-			# Force a fold or minimum loss action
-			if betting.can_bet(state):
-				action = betting.CHECK
-			else:
-				action = betting.FOLD
-			state = betting.act(state, action)
-			break
-		state  = betting.act(state, action)
+	while not is_terminal[state]:
+		player    = actor[state]
+		card      = cards[player]
+		validated = validated_players[player]
+		table     = validated.table
 
-	shown_cards = [cards[i] if betting.at_showdown(state, i) else None for i in range(3)]
+		if table is None:
+			action = _safe_act(validated, state, card)
+		else:
+			key    = state << 2 | card
+			action = table[key]
+			if action == RANDOM:
+				if rand is None:
+					action = _safe_act(validated, state, card)
+				else:
+					# a bool, which indexes like 0/1
+					action = rand() < validated.probs[key]
+		state = transitions[state][action]
 
-	for i in range(3):
-		players[i].end_hand(i, cards[i], state, shown_cards)
+	if (validated_players[0].needs_end_hand or validated_players[1].needs_end_hand
+			or validated_players[2].needs_end_hand):
+		mask        = betting._SHOWDOWN_MASK[state]
+		shown_cards = [cards[i] if mask >> i & 1 else None for i in range(3)]
+
+		for i in range(3):
+			if validated_players[i].needs_end_hand:
+				validated_players[i].end_hand(i, cards[i], state, shown_cards)
 
 	the_winner = winner(state, cards)
-	pot_size   = betting.pot_size(state)
 
-	return (state, [pot_size*(i == the_winner) - betting.pot_contribution(state, i) for i in range(3)])
+	return (state, list(_OUTCOMES[state][2][the_winner]))
+
+def _compile_steps(table, probs):
+	# Fold the betting transitions into one player's policy: a table indexed
+	# by information set (see policy.infoset) holding the next state, or -1
+	# if the decision is randomised, in which case the probability of
+	# action 1 is in the matching entry of the second table.
+	steps = []
+	step_probs = []
+	for state in range(betting.num_internal()):
+		for card in range(deck.num_cards()):
+			key    = state << 2 | card
+			action = table[key]
+			if action == RANDOM:
+				steps.append(-1)
+				step_probs.append(probs[key])
+			else:
+				steps.append(betting._TRANSITIONS[state][action])
+				step_probs.append(float(action))
+	return (tuple(steps), tuple(step_probs))
+
+# (information set, acting seat) for every information set, in order.
+_KEY_SEATS = tuple(
+	(state << 2 | card, betting._ACTOR[state])
+	for state in range(betting.num_internal())
+	for card in range(deck.num_cards())
+)
+
+def _seat_table(tables, order):
+	# Combine per-player tables indexed by information set into the table
+	# for one seating, taking each entry from the player in the acting seat.
+	seated = [tables[i] for i in order]
+	return tuple([seated[seat][key] for key, seat in _KEY_SEATS])
+
+def _compile_jump(steps, cards):
+	# For one deal, where each state leads once the deterministic decisions
+	# under the given step table have been followed: the state itself if it
+	# is terminal or a randomised decision, otherwise the first such state
+	# reached from it.  Every transition leads to a higher-numbered state, so
+	# one pass from the last internal state back to the root suffices.
+	# Returns a list indexed by state.
+	actor = betting._ACTOR
+	jump  = list(range(betting.num_states()))
+	for state in range(betting.num_internal() - 1, -1, -1):
+		next_state = steps[state << 2 | cards[actor[state]]]
+		if next_state >= 0:
+			jump[state] = jump[next_state]
+	return jump
+
+# Below this many hands a match is played hand by hand from the step
+# tables: compiling jumps and tallying deals costs more than it saves.
+_JUMP_MIN_HANDS = 2000
+
+def play_tabular_hands(validated_players, deals, button_rotation=True, rand=None,
+		cache=None):
+	# Fast path for a whole match between three validated tabular players
+	# that have no start_hand/end_hand hooks.  rand is used as in play_hand.
+	# Returns the total payoff of each player.
+	#
+	# Each player's policy is folded into a step table (see _compile_steps)
+	# keyed by its (table, probs) tuples, which validation guarantees are
+	# immutable.  If cache (a dict) is given the step tables are kept there
+	# for later calls; its owner decides how long they live (Match keeps one
+	# per Match object).
+	#
+	# Short matches are played hand by hand from the step tables.  In longer
+	# ones, a hand's payoffs depend only on the seating, the deal (a tuple,
+	# as from deck.deals) and the terminal state, so the loop only tallies
+	# how often each (state, deal) pair comes up.  Deterministic decisions
+	# are compiled away per seating and deal as deals come up: hands that
+	# need random draws only visit their randomised decisions, and the
+	# others are not played at all.  Each pair that occurred is then
+	# settled once.
+	is_terminal = betting._IS_TERMINAL
+	actor       = betting._ACTOR
+	transitions = betting._TRANSITIONS
+	outcomes    = _OUTCOMES
+	root        = betting.root()
+
+	if cache is None:
+		cache = {}
+	compiled = []
+	for validated in validated_players:
+		policy = (validated.table, validated.probs)
+		entry  = cache.get(policy)
+		if entry is None:
+			entry = cache[policy] = _compile_steps(*policy)
+		compiled.append(entry)
+
+	if button_rotation:
+		seatings = ((0, 1, 2), (1, 2, 0), (2, 0, 1))
+	else:
+		seatings = ((0, 1, 2),)
+	num_seatings = len(seatings)
+	all_steps    = [steps for steps, _ in compiled]
+	all_probs    = [probs for _, probs in compiled]
+	seat_steps   = [_seat_table(all_steps, order) for order in seatings]
+	seat_probs   = [_seat_table(all_probs, order) for order in seatings]
+
+	totals = [0, 0, 0]
+	if len(deals) < _JUMP_MIN_HANDS:
+		for hand_num, cards in enumerate(deals):
+			seating = hand_num % num_seatings
+			order   = seatings[seating]
+			steps   = seat_steps[seating]
+			probs   = seat_probs[seating]
+
+			state = root
+			while not is_terminal[state]:
+				key        = state << 2 | cards[actor[state]]
+				next_state = steps[key]
+				if next_state < 0:
+					if rand is None:
+						seat   = actor[state]
+						action = _safe_act(validated_players[order[seat]], state, cards[seat])
+					else:
+						action = rand() < probs[key]
+					next_state = transitions[state][action]
+				state = next_state
+
+			# settle inline, as winner() does
+			contenders, the_winner, deltas = outcomes[state]
+			if contenders:
+				best_card = -1
+				for i in contenders:
+					if cards[i] > best_card:
+						the_winner = i
+						best_card  = cards[i]
+			delta = deltas[the_winner]
+			totals[order[0]] += delta[0]
+			totals[order[1]] += delta[1]
+			totals[order[2]] += delta[2]
+		return totals
+
+	# {deal: jump} per seating, compiled as deals come up; deals that end
+	# without any random draw, by count; (state, deal) tallies for the rest
+	jumps        = [{} for _ in seatings]
+	dealt        = [{} for _ in seatings]
+	ended        = [{} for _ in seatings]
+
+	for hand_num, cards in enumerate(deals):
+		seating = hand_num % num_seatings
+		known   = dealt[seating]
+		if cards in known:
+			known[cards] += 1
+			continue
+
+		seating_jumps = jumps[seating]
+		jump = seating_jumps.get(cards)
+		if jump is None:
+			jump = seating_jumps[cards] = _compile_jump(seat_steps[seating], cards)
+
+		state = jump[root]
+		if is_terminal[state]:
+			known[cards] = 1
+			continue
+
+		probs = seat_probs[seating]
+		while not is_terminal[state]:
+			seat = actor[state]
+			if rand is None:
+				order  = seatings[seating]
+				action = _safe_act(validated_players[order[seat]], state, cards[seat])
+			else:
+				action = rand() < probs[state << 2 | cards[seat]]
+			state = jump[transitions[state][action]]
+
+		key        = (state, cards)
+		tally      = ended[seating]
+		tally[key] = tally.get(key, 0) + 1
+
+	for seating, order in enumerate(seatings):
+		tally = ended[seating]
+		seating_jumps = jumps[seating]
+		for cards, count in dealt[seating].items():
+			key        = (seating_jumps[cards][root], cards)
+			tally[key] = tally.get(key, 0) + count
+
+		for (state, cards), count in tally.items():
+			# settle inline, as winner() does
+			contenders, the_winner, deltas = outcomes[state]
+			if contenders:
+				best_card = -1
+				for i in contenders:
+					if cards[i] > best_card:
+						the_winner = i
+						best_card  = cards[i]
+			delta = deltas[the_winner]
+			totals[order[0]] += count*delta[0]
+			totals[order[1]] += count*delta[1]
+			totals[order[2]] += count*delta[2]
+
+	return totals
@@ -1,4 +1,5 @@
 import random
+from itertools import permutations
 
 JACK  = 0
 QUEEN = 1
@@ -28,6 +29,12 @@ def shuffled(rng=random.Random()):
     rng.shuffle(cards)
     return cards
 
+# only the first three cards of a shuffle are ever dealt, so a deal is one of
+# the 24 ordered 3-card permutations of the deck
+__deals = tuple(permutations(range(num_cards()), 3))
+def deals(num_hands, rng=random.Random()):
+    return rng.choices(__deals, k=num_hands)
+
 if __name__ == "__main__":
     assert card_to_string(0) == 'J'
     assert card_to_string(1) == 'Q'
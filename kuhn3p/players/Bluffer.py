@@ -1,27 +1,28 @@
 import random
-from kuhn3p import betting, deck, Player
+from kuhn3p import betting, deck, Player, TabularPolicy
+
+class Bluffer(TabularPolicy, Player):
+    # Fixed parameters only; decisions are read from the policy table
+    STATELESS = True
 
-class Bluffer(Player):
     def __init__(self, bluff, rng=random.Random()):
         assert bluff >= 0 and bluff <= 1
 
         self.bluff = bluff
         self.rng   = rng 
+        self.build_table()
 
-    def act(self, state, card):
+    def action_probability(self, state, card):
         if betting.can_bet(state):
             if card < deck.ACE:
-                if self.rng.random() < self.bluff:
-                    return betting.BET
-                else:
-                    return betting.CHECK
+                return self.bluff
             else:
-                return betting.BET
+                return 1.0
         else:
             if card == deck.ACE:
-                return betting.CALL
+                return 0.0
             else:
-                return betting.FOLD
+                return 1.0
 
     def __str__(self):
         return 'Bluffer(bluff=%f)' % (self.bluff)
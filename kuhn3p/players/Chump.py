@@ -1,7 +1,10 @@
 import random
 import kuhn3p
 
-class Chump(kuhn3p.Player):
+class Chump(kuhn3p.TabularPolicy, kuhn3p.Player):
+    # Fixed parameters only; decisions are read from the policy table
+    STATELESS = True
+
     def __init__(self, bet, call, fold, rng=random.Random()):
         assert bet >= 0
         assert call >= 0
@@ -12,18 +15,15 @@ class Chump(kuhn3p.Player):
         self.p1  = call / (0.0 + call + bet)
         self.p2  = call / (0.0 + call + fold)
         self.rng = rng 
+        self.build_table()
 
-    def act(self, state, card):
+    def action_probability(self, state, card):
         if kuhn3p.betting.can_bet(state):
             p = self.p1
         else:
             p = self.p2
 
-        dart = self.rng.random()
-        if dart < p:
-            return 0
-        else:
-            return 1
+        return 1 - p
 
     def __str__(self):
         return 'Chump(bet=%f,fold=%f)' % (1 - self.p1, 1 - self.p2)
@@ -0,0 +1,109 @@
+"""
+Table-driven policies for agents whose decisions depend only on the
+betting state and the card held.
+
+Such agents describe their strategy once through action_probability();
+the table built from it replaces the per-decision Python logic in act(),
+and lets the dealer look decisions up without calling into the agent.
+"""
+
+from kuhn3p import betting, deck
+
+# Table entries: 0 and 1 are deterministic actions, RANDOM means draw
+# against the probability stored for that cell.
+RANDOM = 2
+
+
+def infoset(state, card):
+    """
+    Pack a decision point into a small integer.
+
+    The card takes the low two bits and the internal betting state (which
+    encodes the action history) the four above, so every information set
+    maps to a distinct index in [0, num_infosets()).
+
+    Args:
+        state: Internal betting state (0-11)
+        card: Card held (0-3)
+
+    Returns:
+        Information set index
+    """
+    return state << 2 | card
+
+
+def num_infosets():
+    return betting.num_internal() << 2
+
+
+class TabularPolicy:
+    """
+    Mixin for agents whose act() is a fixed, possibly randomised, function
+    of (state, card).
+
+    Subclasses implement action_probability() and call build_table() at the
+    end of __init__.  When act() is called directly, stochastic cells draw
+    from self.rng, which subclasses must provide; inside a Match the dealer
+    draws them from the match RNG instead, so seeded matches are
+    reproducible.  The table is built once, so later changes to the
+    parameters action_probability() reads are not picked up unless
+    build_table() is called again.
+    """
+
+    __slots__ = ('_table', '_probs')
+
+    def action_probability(self, state, card):
+        """
+        Probability of taking action 1 (bet, or fold when facing a bet).
+
+        Args:
+            state: Internal betting state (0-11)
+            card: Card held (0-3)
+
+        Returns:
+            Probability in [0, 1]; 0 and 1 give deterministic actions
+        """
+        raise NotImplementedError
+
+    def build_table(self):
+        """
+        Evaluate action_probability() for every (state, card) pair.
+
+        Returns:
+            Tuple of 0, 1 or RANDOM, indexed by infoset(state, card)
+        """
+        table = []
+        probs = []
+        for state in range(betting.num_internal()):
+            for card in range(deck.num_cards()):
+                p = float(self.action_probability(state, card))
+                if p <= 0.0:
+                    table.append(0)
+                elif p >= 1.0:
+                    table.append(1)
+                else:
+                    table.append(RANDOM)
+                probs.append(p)
+
+        self._table = tuple(table)
+        self._probs = tuple(probs)
+        return self._table
+
+    def act(self, state, card):
+        key = state << 2 | card
+        action = self._table[key]
+        if action == RANDOM:
+            return int(self.rng.random() < self._probs[key])
+        return action
+
+
+def is_tabular(agent):
+    """
+    Check whether an agent's decisions come entirely from its policy table.
+
+    Subclasses that override act() are not tabular, even if they also
+    built a table.
+    """
+    return (isinstance(agent, TabularPolicy)
+            and type(agent).act is TabularPolicy.act
+            and hasattr(agent, '_table'))
@@ -15,16 +15,20 @@ Key design principles
 
 import copy
 import csv
+import hashlib
+import heapq
 import json
 import multiprocessing
+import operator
 import os
+import pickle
 import sys
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from itertools import combinations
 from random import Random
 
-from kuhn3p import betting, deck, dealer
+from kuhn3p import Player, betting, deck, dealer
 from kuhn3p.validator import AgentValidator
 
 # All 6 permutations of seating slots [0,1,2] arranged so that every pair
@@ -97,6 +101,11 @@ def _make_hand_record(
     return record
 
 
+def _write_lines(lines):
+    """Write *lines* to stdout with a single write() instead of a print() each."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
 # ---------------------------------------------------------------------------
 # Module-level worker (must be top-level for pickle / fork)
 # ---------------------------------------------------------------------------
@@ -109,12 +118,13 @@ def _run_match_worker(
     seed,
     record_hands,
     round_num=0,
+    match=None,
 ):
     """
     Worker function executed in a subprocess for each match.
 
-    Agents arrive as a pickled snapshot; each worker therefore operates on
-    an independent copy — cross-match learning is structurally impossible.
+    Agents arrive as a snapshot of copies made for this match alone, so
+    cross-match learning is structurally impossible.
 
     Structured seating rotation
     ---------------------------
@@ -128,6 +138,9 @@ def _run_match_worker(
     times.  The internal match seed is still derived from `seed` so
     hand sequences remain reproducible.
 
+    If *match* is given it is reset and reused instead of building a new
+    Match (the serial runner does this).
+
     Returns
     -------
     (idx1, idx2, idx3, scores, hand_log)
@@ -141,14 +154,18 @@ def _run_match_worker(
     players  = [agents_snapshot[i] for i in seated]
     names    = [agent_names[i]     for i in seated]
     match_id = (idx1, idx2, idx3)
-    match = Match(
-        players,
-        num_hands    = num_hands,
-        rng          = seed,
-        agent_names  = names,
-        match_id     = match_id,
-        record_hands = record_hands,
-    )
+    if match is None:
+        match = Match(
+            players,
+            num_hands       = num_hands,
+            rng             = seed,
+            agent_names     = names,
+            match_id        = match_id,
+            record_hands    = record_hands,
+            verify_zero_sum = False,
+        )
+    else:
+        match.reset(players, rng=seed, agent_names=names, match_id=match_id)
     scores = match.play()
     # Un-permute: map match-player-slot scores back to the (idx1,idx2,idx3) order.
     result_scores = [0, 0, 0]
@@ -157,10 +174,109 @@ def _run_match_worker(
     return (idx1, idx2, idx3, result_scores, match.hand_log)
 
 
+# (agents, agent_names) of the tournament a worker process serves, set once
+# per worker by _init_worker, and the Match the worker reuses for its tasks.
+_WORKER_AGENTS = None
+_WORKER_MATCH  = None
+
+
+def _init_worker(agents, agent_names, agent_files=()):
+    """
+    Pool initializer: keep the tournament's agents in the worker.
+
+    A spawned worker starts from a fresh interpreter that has not loaded
+    the agent modules read from files, so there *agents* arrives pickled
+    and the modules listed in *agent_files* are loaded before unpickling it.
+    """
+    global _WORKER_AGENTS, _WORKER_MATCH
+    if isinstance(agents, bytes):
+        from kuhn3p.agents import _import_agent_files
+        _import_agent_files(agent_files)
+        agents = pickle.loads(agents)
+    _WORKER_AGENTS = (agents, agent_names)
+    _WORKER_MATCH  = None
+
+
+def _run_one_match(task):
+    """
+    Run one scheduled match in a worker process for ``Executor.map``.
+
+    *task* is ``(idx1, idx2, idx3, num_hands, seed, record_hands,
+    round_num)``; the match is played by fresh deep copies of the three
+    agents, so matches run by the same worker cannot share state.  As in the
+    serial runner, one Match object per worker is reset for every task.
+    """
+    global _WORKER_MATCH
+    agents, agent_names = _WORKER_AGENTS
+    idx1, idx2, idx3, num_hands, _, record_hands, _ = task
+    if _WORKER_MATCH is None:
+        _WORKER_MATCH = Match(
+            [Player()] * 3,
+            num_hands       = num_hands,
+            record_hands    = record_hands,
+            verify_zero_sum = False,
+        )
+    snapshot = {i: copy.deepcopy(agents[i]) for i in (idx1, idx2, idx3)}
+    return _run_match_worker(snapshot, agent_names, *task, _WORKER_MATCH)
+
+
+def _match_seed(seed, round_num, idx1, idx2, idx3):
+    """
+    Seed for one match, derived from the tournament seed and the match's
+    place in the schedule alone, so any match's seed can be computed without
+    generating the ones before it.
+    """
+    key = f"{seed}:{round_num}:{idx1}:{idx2}:{idx3}".encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'big')
+
+
+def _match_schedule(triples, num_rounds, seed=None):
+    """
+    Generate the match schedule for a round-robin over the matchups in
+    *triples* (index triples, as from combinations(range(n), 3)).
+
+    Yields ``(triple, match_seed, round_num)`` tuples, one per matchup per
+    round, without materialising the schedule; the triple objects themselves
+    are reused in every round.  Every match gets its own seed from
+    _match_seed, so the outcome of a match does not depend on the order in
+    which matches are executed and the serial and parallel runners deal
+    identical cards for the same seed.  Without a seed, a random one is
+    drawn for the whole tournament.
+    """
+    if seed is None:
+        seed = Random().getrandbits(64)
+    for round_num in range(num_rounds):
+        for triple in triples:
+            yield (triple, _match_seed(seed, round_num, *triple), round_num)
+
+
 # ---------------------------------------------------------------------------
 # Match
 # ---------------------------------------------------------------------------
 
+# Slots (0, 1, 2) in finishing order for scores (a, b, c), indexed by
+# (a >= b) << 2 | (a >= c) << 1 | (b >= c).  Ties go to the lower slot, as
+# in a stable descending sort; the two None entries are contradictory.
+_RANK_TABLE = (
+    (2, 1, 0),   # c > b > a
+    (1, 2, 0),   # b >= c > a
+    None,
+    (1, 0, 2),   # b > a >= c
+    (2, 0, 1),   # c > a >= b
+    None,
+    (0, 2, 1),   # a >= c > b
+    (0, 1, 2),   # a >= b >= c
+)
+
+
+def _plays_from_table(validated):
+    """True if a validated player is tabular and has no per-hand hooks."""
+    agent_type = type(validated.agent)
+    return (validated.table is not None
+            and agent_type.start_hand is Player.start_hand
+            and not validated.needs_end_hand)
+
+
 class Match:
     """Represents a match between three players over multiple hands."""
 
@@ -172,31 +288,56 @@ class Match:
         agent_names=None,
         match_id=None,
         record_hands=False,
+        verify_zero_sum=True,
     ):
         """
         Parameters
         ----------
-        players      : list of 3 Player instances
-        num_hands    : number of hands to play
-        rng          : Random instance or integer seed
-        agent_names  : display names for the three players
-        match_id     : tuple identifier written into hand records
-        record_hands : if True, populate self.hand_log with one dict per hand
+        players         : list of 3 Player instances (or AgentValidator wrappers)
+        num_hands       : number of hands to play
+        rng             : Random instance or integer seed
+        agent_names     : display names for the three players
+        match_id        : tuple identifier written into hand records
+        record_hands    : if True, populate self.hand_log with one dict per hand
+        verify_zero_sum : warn if the final scores do not sum to zero.  Every
+                          hand's payoffs already sum to zero by construction
+                          (see dealer._OUTCOMES), so tournament runs skip it.
+        """
+        self.num_hands       = num_hands
+        self.record_hands    = record_hands
+        self.verify_zero_sum = verify_zero_sum
+        # Step tables compiled by dealer.play_tabular_hands, one per policy.
+        # Kept across reset(), so a Match reused for a whole run compiles
+        # each of the run's agents once, and they are freed with the Match.
+        self._step_tables    = {}
+        self.reset(players, rng=rng if rng is not None else Random(),
+                   agent_names=agent_names, match_id=match_id)
+
+    def reset(self, players, rng=None, agent_names=None, match_id=None):
+        """
+        Prepare this match for a new set of players, so that one Match
+        object can be reused for many matches.
+
+        Scores and the hand log start afresh; num_hands, record_hands,
+        verify_zero_sum and the compiled step tables are kept.  Parameters
+        are as for __init__, except that rng=None keeps the current RNG.
         """
         assert len(players) == 3, "Match requires exactly 3 players"
-        self.players      = players
-        self.num_hands    = num_hands
         self.agent_names  = agent_names or [str(p) for p in players]
+        # Validation wrappers are created once per match, not once per hand.
+        # Existing wrappers (including validator subclasses) are recognised
+        # by isinstance, which an agent cannot spoof to skip validation.
+        self.players      = dealer._wrap_players(players)
         self.match_id     = match_id or (0, 1, 2)
-        self.record_hands = record_hands
 
-        if rng is None:
-            rng = Random()
-        elif isinstance(rng, int):
+        if isinstance(rng, int):
             r = Random()
             r.seed(rng)
             rng = r
-        self.rng      = rng
+        if rng is not None:
+            self.rng  = rng
+        # New lists rather than clearing: play() returns self.scores and
+        # callers may still hold the previous match's lists.
         self.scores   = [0, 0, 0]
         self.hand_log = []   # populated only when record_hands=True
 
@@ -208,6 +349,22 @@ class Match:
         ----------
         button_rotation : rotate the dealer button each hand (default True)
         """
+        # All deals are drawn in one batch instead of shuffling per hand.
+        # The same RNG then drives the randomised decisions of tabular
+        # agents, so a seeded match is fully reproducible.
+        deals = deck.deals(self.num_hands, self.rng)
+
+        if not self.record_hands and all(_plays_from_table(p) for p in self.players):
+            # Nothing observes individual hands, so the whole match can be
+            # played from the policy tables in a single loop.
+            totals = dealer.play_tabular_hands(
+                self.players, deals, button_rotation, rand=self.rng.random,
+                cache=self._step_tables,
+            )
+            for i in range(3):
+                self.scores[i] += totals[i]
+            return self._checked_scores()
+
         for hand_num in range(self.num_hands):
             if button_rotation:
                 first  = hand_num % 3
@@ -218,9 +375,9 @@ class Match:
                 order = [0, 1, 2]
 
             hand_players = [self.players[order[i]] for i in range(3)]
-            cards_dealt  = deck.shuffled(self.rng)
+            cards_dealt  = deals[hand_num]
 
-            state, delta = dealer.play_hand(hand_players, cards_dealt)
+            state, delta = dealer.play_hand(hand_players, cards_dealt, rand=self.rng.random)
 
             for i in range(3):
                 self.scores[order[i]] += delta[i]
@@ -228,9 +385,10 @@ class Match:
             if self.record_hands:
                 seat_cards   = [cards_dealt[order[i]] for i in range(3)]
                 seat_payoffs = list(delta)
+                mask  = betting._SHOWDOWN_MASK[state]
                 shown = [
                     cards_dealt[order[i]]
-                    if betting.at_showdown(state, i) else None
+                    if mask >> i & 1 else None
                     for i in range(3)
                 ]
                 self.hand_log.append(_make_hand_record(
@@ -243,6 +401,12 @@ class Match:
                     shown_cards    = shown,
                 ))
 
+        return self._checked_scores()
+
+    def _checked_scores(self):
+        """Warn if the scores are not zero-sum (when enabled), then return them."""
+        if not self.verify_zero_sum:
+            return self.scores
         score_sum = sum(self.scores)
         if abs(score_sum) > 0.1:
             import warnings
@@ -300,51 +464,54 @@ class Tournament:
         Serial round-robin tournament.
 
         Agents are deep-copied before every match (cross-match learning
-        is prohibited).  Tasks run sequentially in the main process.
+        is prohibited).  Tasks run sequentially in the main process.  Match
+        seeds are derived exactly as in run_round_robin_parallel, so both
+        runners deal the same cards for the same seed.
 
         Parameters
         ----------
         record_hands : capture per-hand data into self.hand_log
         """
         n        = len(self.agents)
-        rng      = Random(seed)
-        matchups = list(combinations(range(n), 3))
-        total    = len(matchups) * num_rounds
+        # Built per run, so agents added since construction take part; each
+        # triple is the matchups key in every round
+        triples  = tuple(combinations(range(n), 3))
+        tasks    = _match_schedule(triples, num_rounds, seed)
+        total    = len(triples) * num_rounds
 
         if verbose:
-            print(f"Tournament (serial): {n} agents")
-            print(f"Total unique matchups: {len(matchups)}")
-            print(f"Rounds per matchup:    {num_rounds}")
-            print(f"Hands per match:       {hands_per_matchup}")
-            print()
+            _write_lines([
+                f"Tournament (serial): {n} agents",
+                f"Total unique matchups: {len(triples)}",
+                f"Rounds per matchup:    {num_rounds}",
+                f"Hands per match:       {hands_per_matchup}",
+                "",
+            ])
+
+        agent_names = [name for name, _ in self.agents]
+        # One Match object is reset and reused for every task; the
+        # placeholder players are replaced before the first hand.
+        match = Match(
+            [Player()] * 3,
+            num_hands       = hands_per_matchup,
+            record_hands    = record_hands,
+            verify_zero_sum = False,
+        )
 
         done = 0
-        for round_num in range(num_rounds):
-            seat_perm = _SEAT_PERMS[round_num % 6]
-            for idx1, idx2, idx3 in matchups:
-                done += 1
-                all_idx = [idx1, idx2, idx3]
-                seated  = [all_idx[seat_perm[k]] for k in range(3)]
-                players = [copy.deepcopy(self.agents[seated[k]][1]) for k in range(3)]
-                names   = [self.agents[seated[k]][0]               for k in range(3)]
-                match = Match(
-                    players,
-                    num_hands    = hands_per_matchup,
-                    rng          = rng,
-                    agent_names  = names,
-                    match_id     = (idx1, idx2, idx3),
-                    record_hands = record_hands,
-                )
-                raw_scores = match.play()
-                # Un-permute scores back to (idx1, idx2, idx3) order.
-                scores = [0, 0, 0]
-                for k in range(3):
-                    scores[seat_perm[k]] = raw_scores[k]
-                self.matchups.setdefault((idx1, idx2, idx3), []).append(scores)
-                if record_hands:
-                    self.hand_log.extend(match.hand_log)
-                if verbose and done % max(1, total // 10) == 0:
-                    print(f"Progress: {done}/{total} matches completed")
+        for triple, task_seed, round_num in tasks:
+            done += 1
+            snapshot = {i: copy.deepcopy(self.agents[i][1]) for i in triple}
+            _, _, _, scores, hand_log = _run_match_worker(
+                snapshot, agent_names,
+                *triple, hands_per_matchup, task_seed, record_hands,
+                round_num, match,
+            )
+            self.matchups.setdefault(triple, []).append(scores)
+            if record_hands:
+                self.hand_log.extend(hand_log)
+            if verbose and done % max(1, total // 10) == 0:
+                print(f"Progress: {done}/{total} matches completed")
 
         self._calculate_results()
         if verbose:
@@ -368,9 +535,13 @@ class Tournament:
         Parallel round-robin using ProcessPoolExecutor.
 
         Uses 'fork' on Unix/macOS and 'spawn' on Windows.  Each match task
-        runs in an isolated subprocess.  Agents are pickled (deep-copied) at
-        the point of task submission, so cross-match learning is structurally
-        impossible.
+        runs in an isolated subprocess.  The agents are handed to every
+        worker once, when it starts (inherited under fork, pickled once per
+        worker under spawn, where agent modules loaded from files are loaded
+        again in each worker), and each match is played by fresh deep copies
+        of its three agents, so cross-match learning is structurally
+        impossible.  Under spawn, agents that cannot be pickled are run by
+        run_round_robin instead.
 
         Note: on Windows the calling script must guard its entry point with
         ``if __name__ == '__main__':`` to prevent recursive worker spawning.
@@ -381,48 +552,60 @@ class Tournament:
         record_hands : capture per-hand data into self.hand_log
         """
         n           = len(self.agents)
-        rng         = Random(seed)
-        matchups    = list(combinations(range(n), 3))
-        total_tasks = len(matchups) * num_rounds
+        triples     = tuple(combinations(range(n), 3))
+        tasks       = _match_schedule(triples, num_rounds, seed)
+        total_tasks = len(triples) * num_rounds
 
         if max_workers is None:
             max_workers = os.cpu_count() or 1
 
-        if verbose:
-            print(f"Tournament (parallel, {max_workers} workers): {n} agents")
-            print(f"Total unique matchups: {len(matchups)}")
-            print(f"Rounds per matchup:    {num_rounds}")
-            print(f"Hands per match:       {hands_per_matchup}")
-            print(f"Total tasks:           {total_tasks}")
-            print()
-
         agents_snap = [a for _, a in self.agents]
         agent_names = [n for n, _ in self.agents]
 
-        tasks = []
-        for round_num in range(num_rounds):
-            for idx1, idx2, idx3 in matchups:
-                tasks.append((idx1, idx2, idx3, rng.randint(0, 2**31 - 1), round_num))
+        start_method = 'fork' if sys.platform != 'win32' else 'spawn'
+        mp_context   = multiprocessing.get_context(start_method)
+        if start_method == 'fork':
+            initargs = (agents_snap, agent_names)
+        else:
+            try:
+                agents_pickle = pickle.dumps(agents_snap)
+            except Exception:
+                if verbose:
+                    print("Agents cannot be sent to worker processes; running serially\n")
+                return self.run_round_robin(
+                    hands_per_matchup, num_rounds, seed, verbose, record_hands,
+                )
+            from kuhn3p.agents import _agent_files
+            initargs = (agents_pickle, agent_names, _agent_files(agents_snap))
 
-        mp_context = multiprocessing.get_context(
-            'fork' if sys.platform != 'win32' else 'spawn'
+        if verbose:
+            _write_lines([
+                f"Tournament (parallel, {max_workers} workers): {n} agents",
+                f"Total unique matchups: {len(triples)}",
+                f"Rounds per matchup:    {num_rounds}",
+                f"Hands per match:       {hands_per_matchup}",
+                f"Total tasks:           {total_tasks}",
+                "",
+            ])
+
+        # Tasks carry only indices and seeds; the agents reach the workers
+        # through the pool initializer.
+        task_args = (
+            (*triple, hands_per_matchup, task_seed, record_hands, round_num)
+            for triple, task_seed, round_num in tasks
         )
+        chunksize = max(1, total_tasks // (8 * max_workers))
+
         completed = 0
         with ProcessPoolExecutor(
             max_workers=max_workers,
             mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=initargs,
         ) as pool:
-            futures = {
-                pool.submit(
-                    _run_match_worker,
-                    agents_snap, agent_names,
-                    idx1, idx2, idx3, hands_per_matchup, task_seed, record_hands,
-                    round_num,
-                ): (idx1, idx2, idx3)
-                for idx1, idx2, idx3, task_seed, round_num in tasks
-            }
-            for future in as_completed(futures):
-                idx1, idx2, idx3, scores, hand_log = future.result()
+            for idx1, idx2, idx3, scores, hand_log in pool.map(
+                _run_one_match, task_args, chunksize=chunksize,
+            ):
                 self.matchups.setdefault((idx1, idx2, idx3), []).append(scores)
                 if record_hands:
                     self.hand_log.extend(hand_log)
@@ -440,49 +623,64 @@ class Tournament:
     # ------------------------------------------------------------------
 
     def _calculate_results(self):
+        # Accumulate into parallel per-agent lists (indexed by agent index)
+        # and build the per-agent result dicts once at the end.
+        n              = len(self.agents)
+        total_score    = [0] * n
+        places         = ([0] * n, [0] * n, [0] * n)
+        match_scores   = [[] for _ in range(n)]
+        # (opp1_name, opp2_name) tuple -> list of per-match scores
+        matchup_scores = [{} for _ in range(n)]
+
+        for (idx1, idx2, idx3), matches in self.matchups.items():
+            indices = (idx1, idx2, idx3)
+            # (opp1_name, opp2_name) for each slot, fixed for the matchup
+            opp_names = [
+                tuple(self.agents[indices[j]][0] for j in range(3) if j != pos)
+                for pos in range(3)
+            ]
+            # per-slot score lists for this matchup
+            slot_scores = [
+                matchup_scores[indices[pos]].setdefault(opp_names[pos], [])
+                for pos in range(3)
+            ]
+            for scores in matches:
+                a, b, c = scores
+                ranking = _RANK_TABLE[(a >= b) << 2 | (a >= c) << 1 | (b >= c)]
+                for place, pos in enumerate(ranking):
+                    i     = indices[pos]
+                    score = scores[pos]
+                    total_score[i]  += score
+                    places[place][i] += 1
+                    match_scores[i].append(score)
+                    slot_scores[pos].append(score)
+
+        first, second, third = places
         self.results = {
             i: {
                 'name':              self.agents[i][0],
-                'total_score':       0,
-                'matches_played':    0,
-                'num_first_places':  0,
-                'num_second_places': 0,
-                'num_third_places':  0,
-                'match_scores':      [],
-                # (opp1_name, opp2_name) tuple -> list of per-match scores
-                'matchup_scores':    {},
+                'total_score':       total_score[i],
+                'matches_played':    first[i] + second[i] + third[i],
+                'num_first_places':  first[i],
+                'num_second_places': second[i],
+                'num_third_places':  third[i],
+                'match_scores':      match_scores[i],
+                'matchup_scores':    matchup_scores[i],
             }
-            for i in range(len(self.agents))
+            for i in range(n)
         }
-        for (idx1, idx2, idx3), matches in self.matchups.items():
-            indices = [idx1, idx2, idx3]
-            for scores in matches:
-                for pos, idx in enumerate(indices):
-                    self.results[idx]['total_score']    += scores[pos]
-                    self.results[idx]['matches_played'] += 1
-                    self.results[idx]['match_scores'].append(scores[pos])
-                    place = sorted(range(3), key=lambda j: scores[j], reverse=True).index(pos)
-                    if   place == 0: self.results[idx]['num_first_places']  += 1
-                    elif place == 1: self.results[idx]['num_second_places'] += 1
-                    else:            self.results[idx]['num_third_places']  += 1
-                    # record per-matchup breakdown
-                    opp_names = tuple(
-                        self.agents[indices[j]][0]
-                        for j in range(3) if j != pos
-                    )
-                    self.results[idx]['matchup_scores'] \
-                        .setdefault(opp_names, []) \
-                        .append(scores[pos])
-
-    def get_rankings(self, sort_by='total_score'):
+
+    def get_rankings(self, sort_by='total_score', top=None):
         if sort_by == 'win_rate':
             key = lambda x: x[1]['num_first_places'] / max(1, x[1]['matches_played'])
         else:
             key = lambda x: x[1][sort_by]
-        return [
-            (s['name'], s)
-            for _, s in sorted(self.results.items(), key=key, reverse=True)
-        ]
+        if top is None:
+            ranked = sorted(self.results.items(), key=key, reverse=True)
+        else:
+            # same order as the sorted list, without sorting all of it
+            ranked = heapq.nlargest(top, self.results.items(), key=key)
+        return [(s['name'], s) for _, s in ranked]
 
     def print_matchup_extremes(self):
         """
@@ -497,9 +695,11 @@ class Tournament:
 
         rankings = self.get_rankings('total_score')
         W = 94
-        print("\n" + "=" * W)
-        print("Best & Worst Matchups Per Agent  (average chips vs that opponent pair)")
-        print("=" * W)
+        lines = [
+            "\n" + "=" * W,
+            "Best & Worst Matchups Per Agent  (average chips vs that opponent pair)",
+            "=" * W,
+        ]
 
         for name, s in rankings:
             ms = s.get('matchup_scores', {})
@@ -516,32 +716,40 @@ class Tournament:
             best_n     = len(ms[best_pair])
             worst_n    = len(ms[worst_pair])
 
-            print(f"\n  {name}")
+            lines.append(f"\n  {name}")
             opp_str = ' & '.join(best_pair)
-            print(f"    Best  vs  {opp_str:<44}  avg {best_avg:>+9.1f}  "
-                  f"({best_n} match{'es' if best_n != 1 else ''})")
+            lines.append(f"    Best  vs  {opp_str:<44}  avg {best_avg:>+9.1f}  "
+                         f"({best_n} match{'es' if best_n != 1 else ''})")
             opp_str = ' & '.join(worst_pair)
-            print(f"    Worst vs  {opp_str:<44}  avg {worst_avg:>+9.1f}  "
-                  f"({worst_n} match{'es' if worst_n != 1 else ''})")
+            lines.append(f"    Worst vs  {opp_str:<44}  avg {worst_avg:>+9.1f}  "
+                         f"({worst_n} match{'es' if worst_n != 1 else ''})")
 
-        print("\n" + "=" * W)
+        lines.append("\n" + "=" * W)
+        _write_lines(lines)
 
-    def print_results(self, sort_by='total_score'):
-        """Print a formatted rankings table to stdout."""
-        rankings = self.get_rankings(sort_by)
+    def print_results(self, sort_by='total_score', top=None):
+        """Print a formatted rankings table (the first *top* rows, if given) to stdout."""
+        rankings = self.get_rankings(sort_by, top)
         W = 86
-        print("\n" + "=" * W)
-        print(f"Tournament Results (sorted by {sort_by})")
-        print("=" * W)
-        print(f"{'Rank':<6} {'Agent':<28} {'Score':>12} {'Matches':<10} "
-              f"{'1st':<6} {'2nd':<6} {'3rd':<6} {'Score/Match':>12}")
-        print("-" * W)
+        if top is None:
+            title = f"Tournament Results (sorted by {sort_by})"
+        else:
+            title = f"Tournament Results (top {top}, sorted by {sort_by})"
+        lines = [
+            "\n" + "=" * W,
+            title,
+            "=" * W,
+            f"{'Rank':<6} {'Agent':<28} {'Score':>12} {'Matches':<10} "
+            f"{'1st':<6} {'2nd':<6} {'3rd':<6} {'Score/Match':>12}",
+            "-" * W,
+        ]
         for rank, (name, s) in enumerate(rankings, 1):
             spm = s['total_score'] / max(1, s['matches_played'])
-            print(f"{rank:<6} {name:<28} {s['total_score']:>12.1f} "
-                  f"{s['matches_played']:<10} {s['num_first_places']:<6} "
-                  f"{s['num_second_places']:<6} {s['num_third_places']:<6} {spm:>12.2f}")
-        print("=" * W)
+            lines.append(f"{rank:<6} {name:<28} {s['total_score']:>12.1f} "
+                         f"{s['matches_played']:<10} {s['num_first_places']:<6} "
+                         f"{s['num_second_places']:<6} {s['num_third_places']:<6} {spm:>12.2f}")
+        lines.append("=" * W)
+        _write_lines(lines)
 
     # ------------------------------------------------------------------
     # Data export
@@ -601,32 +809,34 @@ class Tournament:
         print(f"Saved: {json_path}")
 
         # match_results.csv
+        match_fields = ('idx0', 'idx1', 'idx2', 'agent0', 'agent1', 'agent2',
+                        'round', 'score0', 'score1', 'score2', 'winner')
         match_rows = []
         for (idx1, idx2, idx3), rounds in self.matchups.items():
-            n0, n1, n2 = (self.agents[idx1][0], self.agents[idx2][0], self.agents[idx3][0])
+            names = (self.agents[idx1][0], self.agents[idx2][0], self.agents[idx3][0])
             for rnd, scores in enumerate(rounds):
-                match_rows.append({
-                    'idx0': idx1, 'idx1': idx2, 'idx2': idx3,
-                    'agent0': n0, 'agent1': n1, 'agent2': n2,
-                    'round':  rnd,
-                    'score0': scores[0], 'score1': scores[1], 'score2': scores[2],
-                    'winner': [n0, n1, n2][scores.index(max(scores))],
-                })
+                match_rows.append((
+                    idx1, idx2, idx3, *names, rnd, *scores,
+                    names[scores.index(max(scores))],
+                ))
         if match_rows:
             csv_match = os.path.join(output_dir, f"match_results{suffix}.csv")
             with open(csv_match, 'w', newline='') as f:
-                w = csv.DictWriter(f, fieldnames=list(match_rows[0].keys()))
-                w.writeheader()
+                w = csv.writer(f)
+                w.writerow(match_fields)
                 w.writerows(match_rows)
             print(f"Saved: {csv_match}  ({len(match_rows)} rows)")
 
         # hand_data.csv
         if self.hand_log:
             csv_hand = os.path.join(output_dir, f"hand_data{suffix}.csv")
+            # Hand records all share the first record's keys; pull the values
+            # out as tuples rather than going through DictWriter row by row.
+            hand_fields = list(self.hand_log[0].keys())
             with open(csv_hand, 'w', newline='') as f:
-                w = csv.DictWriter(f, fieldnames=list(self.hand_log[0].keys()))
-                w.writeheader()
-                w.writerows(self.hand_log)
+                w = csv.writer(f)
+                w.writerow(hand_fields)
+                w.writerows(map(operator.itemgetter(*hand_fields), self.hand_log))
             print(f"Saved: {csv_hand}  ({len(self.hand_log):,} rows)")
 
     # ------------------------------------------------------------------
@@ -778,10 +988,20 @@ class TournamentMatch:
         """
         match  = Match([player1, player2, player3], num_hands=hands, rng=seed)
         scores = match.play()
+
+        # Rank the three scores directly; ties go to the lower position.
+        s0, s1, s2 = scores
+        if s0 >= s1 and s0 >= s2:
+            winner, runner_up = 0, (1 if s1 >= s2 else 2)
+        elif s1 >= s2:
+            winner, runner_up = 1, (0 if s0 >= s2 else 2)
+        else:
+            winner, runner_up = 2, (0 if s0 >= s1 else 1)
+
         return {
             'scores':              scores,
-            'winner':              scores.index(max(scores)),
-            'runner_up':           sorted(range(3), key=lambda i: scores[i], reverse=True)[1],
-            'result':              list(scores),
-            'total_chips_wagered': sum(abs(s) for s in scores),
+            'winner':              winner,
+            'runner_up':           runner_up,
+            'result':              [s0, s1, s2],
+            'total_chips_wagered': abs(s0) + abs(s1) + abs(s2),
         }
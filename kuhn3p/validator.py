@@ -5,6 +5,11 @@ This module wraps player agents to prevent cheating and invalid behavior.
 """
 
 from kuhn3p import Player, betting
+from kuhn3p.policy import RANDOM, is_tabular, num_infosets
+
+# Legal actions keyed by every int accepted for them (bools hash equal to
+# the corresponding ints).
+_ACTIONS = {0: 0, 1: 1}
 
 
 class AgentValidator:
@@ -18,20 +23,41 @@ class AgentValidator:
     - Access to forbidden internals
     """
     
-    def __init__(self, agent, agent_name="Unknown"):
+    __slots__ = ('agent', 'agent_name', 'strict', '_last_error', 'table', 'probs',
+                 'needs_end_hand')
+    
+    def __init__(self, agent, agent_name="Unknown", strict=False):
         """
         Wrap an agent with validation.
         
         Args:
             agent: The Player instance to wrap
             agent_name: Name for error messages
+            strict: Re-check the dealer's inputs and the action's type on
+                every decision (for submission intake and debugging)
         """
         if not isinstance(agent, Player):
             raise TypeError(f"Agent must be instance of kuhn3p.Player, got {type(agent)}")
         
         self.agent = agent
         self.agent_name = agent_name
+        self.strict = strict
         self._last_error = None
+        
+        # Tabular agents are checked once here; the dealer then reads their
+        # deterministic decisions straight from the table instead of calling
+        # act().  The tuples are immutable, so the agent cannot change them
+        # after validation.
+        self.table = None
+        self.probs = None
+        if is_tabular(agent) and _valid_table(agent._table, agent._probs):
+            self.table = agent._table
+            self.probs = agent._probs
+        
+        # Agents that opt out, or keep Player's no-op end_hand(), are not
+        # told about the end of the hand.
+        self.needs_end_hand = (bool(getattr(agent, 'needs_end_hand', True))
+                               and type(agent).end_hand is not Player.end_hand)
     
     def start_hand(self, position, card):
         """Safely call agent's start_hand hook."""
@@ -57,6 +83,42 @@ class AgentValidator:
             ValueError: If agent returns invalid action
             RuntimeError: If agent code crashes
         """
+        if self.strict:
+            return self._act_strict(state, card)
+        
+        try:
+            action = self.agent.act(state, card)
+        except Exception as e:
+            raise RuntimeError(
+                f"Agent '{self.agent_name}' crashed in act(): {type(e).__name__}: {e}"
+            )
+        
+        # The dealer only passes internal states and valid cards, so only
+        # the return value needs checking.  As in strict mode it must be an
+        # int (or bool), so floats such as 1.0 are rejected even though they
+        # compare equal; plain ints and bools then take a single lookup,
+        # which always hands back a plain int.  Any failure (unknown value,
+        # misbehaving int subclass) counts as an invalid action.
+        if type(action) is not int and type(action) is not bool:
+            if not isinstance(action, int):
+                raise ValueError(
+                    f"Agent '{self.agent_name}' returned invalid action type {type(action)}, "
+                    f"expected int (0 or 1)"
+                )
+            try:
+                action = int(action)
+            except Exception:
+                action = None
+        try:
+            return _ACTIONS[action]
+        except Exception:
+            raise ValueError(
+                f"Agent '{self.agent_name}' returned invalid action {action!r}, "
+                f"must be 0 (check/call) or 1 (bet/fold)"
+            )
+    
+    def _act_strict(self, state, card):
+        """act() with every input and output check, for strict mode."""
         # Validate inputs
         if not betting.is_internal(state):
             raise ValueError(f"act() called with non-internal state: {state}")
@@ -111,13 +173,30 @@ class AgentValidator:
             return f"Agent[{self.agent_name}]"
 
 
-def create_safe_player(agent, name="Unknown"):
+def _valid_table(table, probs):
+    """Check that a policy table has one valid entry per information set."""
+    if not (isinstance(table, tuple) and isinstance(probs, tuple)):
+        return False
+    if len(table) != num_infosets() or len(probs) != len(table):
+        return False
+    
+    for action, p in zip(table, probs):
+        if type(action) is not int or action not in (0, 1, RANDOM):
+            return False
+        if action == RANDOM and not (isinstance(p, float) and 0.0 < p < 1.0):
+            return False
+    
+    return True
+
+
+def create_safe_player(agent, name="Unknown", strict=True):
     """
     Create a validated wrapper around an agent.
     
     Args:
         agent: Player instance
         name: Agent name for error messages
+        strict: Use strict validation (see AgentValidator)
         
     Returns:
         AgentValidator wrapping the player
@@ -125,15 +204,16 @@ def create_safe_player(agent, name="Unknown"):
     Raises:
         TypeError: If agent is not a Player instance
     """
-    return AgentValidator(agent, name)
+    return AgentValidator(agent, name, strict=strict)
 
 
-def validate_agents(agents_list):
+def validate_agents(agents_list, strict=True):
     """
     Validate a list of agents.
     
     Args:
         agents_list: List of Player instances or (name, Player) tuples
+        strict: Use strict validation (see AgentValidator)
         
     Returns:
         List of AgentValidator instances
@@ -153,6 +233,6 @@ def validate_agents(agents_list):
         if not isinstance(agent, Player):
             raise TypeError(f"Agent '{name}' is not a Player instance")
         
-        validated.append(AgentValidator(agent, name))
+        validated.append(AgentValidator(agent, name, strict=strict))
     
     return validated
@@ -5,14 +5,16 @@ Tournament runner utility for Kuhn poker agent competition.
 This script provides utilities for running tournaments with competitor agents.
 """
 
+import csv
+import heapq
 import sys
 import argparse
 from pathlib import Path
-from kuhn3p import agents, tournament
 
 
 def run_tournament(agents_list, num_agents=None, hands_per_match=1000, 
-                   num_rounds=1, seed=None, output_file=None):
+                   num_rounds=1, seed=None, output_file=None, max_workers=None,
+                   top=None):
     """
     Run a round-robin tournament.
     
@@ -23,10 +25,16 @@ def run_tournament(agents_list, num_agents=None, hands_per_match=1000,
         num_rounds: Number of rounds
         seed: Random seed for reproducibility
         output_file: Optional file to save results to
+        max_workers: Worker processes for the matches (default: all
+            logical CPUs); 1 plays every match in this process
+        top: If provided, only print the top N agents (the output file
+            still lists every agent)
         
     Returns:
         Tournament object with results
     """
+    from kuhn3p import tournament
+    
     if num_agents:
         agents_list = agents_list[:num_agents]
     
@@ -36,24 +44,39 @@ def run_tournament(agents_list, num_agents=None, hands_per_match=1000,
     print()
     
     t = tournament.Tournament(agents_list)
-    t.run_round_robin(
-        hands_per_matchup=hands_per_match,
-        num_rounds=num_rounds,
-        seed=seed,
-        verbose=True
-    )
+    if max_workers == 1:
+        t.run_round_robin(
+            hands_per_matchup=hands_per_match,
+            num_rounds=num_rounds,
+            seed=seed,
+            verbose=True
+        )
+    else:
+        # Matches are independent, so they are spread over worker processes;
+        # the results are the same as the serial run for the same seed.
+        t.run_round_robin_parallel(
+            hands_per_matchup=hands_per_match,
+            num_rounds=num_rounds,
+            seed=seed,
+            verbose=True,
+            max_workers=max_workers
+        )
     
     # Print results
-    t.print_results()
+    t.print_results(top=top)
     
     # Save results if requested
     if output_file:
-        with open(output_file, 'w') as f:
-            f.write("Rank,Agent,Total Score,Matches,1st Place,2nd Place,3rd Place\n")
-            for rank, (name, stats) in enumerate(t.get_rankings(), 1):
-                f.write(f"{rank},{name},{stats['total_score']},{stats['matches_played']},"
-                       f"{stats['num_first_places']},{stats['num_second_places']},"
-                       f"{stats['num_third_places']}\n")
+        with open(output_file, 'w', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(["Rank", "Agent", "Total Score", "Matches",
+                             "1st Place", "2nd Place", "3rd Place"])
+            writer.writerows(
+                (rank, name, stats['total_score'], stats['matches_played'],
+                 stats['num_first_places'], stats['num_second_places'],
+                 stats['num_third_places'])
+                for rank, (name, stats) in enumerate(t.get_rankings(), 1)
+            )
             print(f"\nResults saved to {output_file}")
     
     return t
@@ -61,6 +84,8 @@ def run_tournament(agents_list, num_agents=None, hands_per_match=1000,
 
 def list_agents(agents_dir):
     """List all agents in a directory."""
+    from kuhn3p import agents
+    
     agents_dict = agents.load_agents_from_directory(agents_dir)
     
     print("Available agents:")
@@ -101,6 +126,15 @@ def main():
                        type=int,
                        help='Random seed for reproducibility')
     
+    parser.add_argument('--workers',
+                       type=int,
+                       help='Worker processes for matches (default: all CPUs; '
+                            '1 runs serially)')
+    
+    parser.add_argument('--top',
+                       type=int,
+                       help='Only print the top N agents')
+    
     parser.add_argument('--output',
                        help='File to save results to (CSV format)')
     
@@ -121,6 +155,8 @@ def main():
             print(f"Agents directory not found: {agents_dir}")
             sys.exit(1)
         
+        from kuhn3p import agents
+        
         # Load agent modules
         print(f"Loading agents from {agents_dir}...")
         discovered_agents = agents.load_agents_from_directory(agents_dir)
@@ -129,10 +165,16 @@ def main():
             print("No agents found!")
             sys.exit(1)
         
-        # Create instances
+        # Create instances, only for the agents that will play (the first
+        # N by name; nsmallest avoids sorting the whole directory for them)
+        if args.num_agents:
+            chosen = heapq.nsmallest(args.num_agents, discovered_agents.items(),
+                                     key=lambda item: item[0])
+        else:
+            chosen = sorted(discovered_agents.items())
         tournament_agents = [
             (name, agent_class())
-            for name, agent_class in sorted(discovered_agents.items())
+            for name, agent_class in chosen
         ]
         
         # Run tournament
@@ -142,7 +184,9 @@ def main():
             hands_per_match=args.hands,
             num_rounds=args.rounds,
             seed=args.seed,
-            output_file=args.output
+            output_file=args.output,
+            max_workers=args.workers,
+            top=args.top
         )
 
 